@@ -1,7 +1,8 @@
 """Data processing and filtering logic for research papers."""
 
+import csv
 import pandas as pd
-from typing import List, Optional
+from typing import Iterable, Iterator, Optional, Tuple
 import logging
 
 from .utils import Paper, FilteredPaper, CompanyDetector, Author
@@ -10,23 +11,35 @@ from .utils import Paper, FilteredPaper, CompanyDetector, Author
 class PaperProcessor:
     """Processes and filters research papers."""
     
+    OUTPUT_COLUMNS = [
+        'PubmedID',
+        'Title',
+        'Publication Date',
+        'Non-academic Author(s)',
+        'Company Affiliation(s)',
+        'Corresponding Author Email'
+    ]
+    CSV_BUFFER_SIZE = 4 * 1024 * 1024
+    
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.company_detector = CompanyDetector()
     
-    def filter_papers_with_company_authors(self, papers: List[Paper]) -> List[FilteredPaper]:
-        """Filter papers that have at least one author from a pharma/biotech company."""
-        filtered_papers = []
-        
+    def filter_papers_with_company_authors(
+        self, papers: Iterable[Paper]
+    ) -> Iterator[FilteredPaper]:
+        """Lazily yield papers that have at least one author from a pharma/biotech company."""
         for paper in papers:
             non_academic_authors = []
             company_affiliations = []
+            seen_companies = set()
             
             for author in paper.authors:
-                if self.company_detector.is_non_academic(author.affiliation):
+                is_non_academic, company_name = self.company_detector.classify(author.affiliation)
+                if is_non_academic:
                     non_academic_authors.append(author.name)
-                    company_name = self.company_detector.extract_company_name(author.affiliation)
-                    if company_name not in company_affiliations:
+                    if company_name not in seen_companies:
+                        seen_companies.add(company_name)
                         company_affiliations.append(company_name)
             
             # Only include papers with at least one non-academic author
@@ -39,46 +52,53 @@ class PaperProcessor:
                     company_affiliations=company_affiliations,
                     corresponding_author_email=paper.corresponding_author_email
                 )
-                filtered_papers.append(filtered_paper)
-        
-        return filtered_papers
+                yield filtered_paper
     
 
     
-    def to_dataframe(self, filtered_papers: List[FilteredPaper]) -> pd.DataFrame:
+    def _to_row(self, paper: FilteredPaper) -> Tuple[str, ...]:
+        """Convert a filtered paper to an output row matching OUTPUT_COLUMNS."""
+        return (
+            paper.pubmed_id,
+            paper.title or '',
+            paper.publication_date,
+            ' | '.join(paper.non_academic_authors),
+            ' | '.join(paper.company_affiliations),
+            paper.corresponding_author_email or ''
+        )
+    
+    def to_dataframe(self, filtered_papers: Iterable[FilteredPaper]) -> pd.DataFrame:
         """Convert filtered papers to pandas DataFrame."""
-        data = []
-
-        for paper in filtered_papers:
-            data.append({
-                'PubmedID': paper.pubmed_id,
-                'Title': paper.title,
-                'Publication Date': paper.publication_date,
-                'Non-academic Author(s)': ' | '.join(paper.non_academic_authors),
-                'Company Affiliation(s)': ' | '.join(paper.company_affiliations),
-                'Corresponding Author Email': paper.corresponding_author_email or ''
-            })
-
-        return pd.DataFrame(data)
+        return pd.DataFrame(
+            [self._to_row(paper) for paper in filtered_papers],
+            columns=self.OUTPUT_COLUMNS
+        )
 
     
-    def save_to_csv(self, filtered_papers: List[FilteredPaper], filename: str) -> None:
-        """Save filtered papers to CSV file in Excel-friendly format."""
-        df = self.to_dataframe(filtered_papers)
-        df.to_csv(
-            filename,
-            index=False,
-            encoding='utf-8-sig',
-            sep=','
-        )
-        self.logger.info(f"Saved {len(filtered_papers)} papers to {filename}")
+    def save_to_csv(self, filtered_papers: Iterable[FilteredPaper], filename: str) -> int:
+        """Save filtered papers to CSV file in Excel-friendly format; return the count."""
+        count = 0
+        with open(filename, 'w', encoding='utf-8-sig', newline='',
+                  buffering=self.CSV_BUFFER_SIZE) as f:
+            writer = csv.writer(f)
+            writer.writerow(self.OUTPUT_COLUMNS)
+            for paper in filtered_papers:
+                writer.writerow(self._to_row(paper))
+                count += 1
+        self.logger.info(f"Saved {count} papers to {filename}")
+        return count
 
     
-    def print_results(self, filtered_papers: List[FilteredPaper]) -> None:
-        """Print results to console."""
-        if not filtered_papers:
+    def print_results(self, filtered_papers: Iterable[FilteredPaper]) -> int:
+        """Print results to console and return the number of papers printed."""
+        rows = [self._to_row(paper) for paper in filtered_papers]
+        if not rows:
             print("No papers found with pharmaceutical/biotech company authors.")
-            return
+            return 0
+        
+        widths = [max(map(len, column)) for column in zip(self.OUTPUT_COLUMNS, *rows)]
+        
+        for row in [self.OUTPUT_COLUMNS, *rows]:
+            print('  '.join(field.ljust(width) for field, width in zip(row, widths)).rstrip())
         
-        df = self.to_dataframe(filtered_papers)
-        print(df.to_string(index=False))
\ No newline at end of file
+        return len(rows)
@@ -65,17 +65,17 @@ def main(query: str, help: bool, debug: bool, filename: Optional[str],
         papers = client.fetch_paper_details(pubmed_ids)
         logger.info(f"Successfully fetched details for {len(papers)} papers")
         
-        # Filter papers with company authors
+        # Filter papers with company authors (lazily, as results are written out)
         logger.info("Filtering papers with pharmaceutical/biotech company authors...")
         filtered_papers = processor.filter_papers_with_company_authors(papers)
-        logger.info(f"Found {len(filtered_papers)} papers with company authors")
         
         # Output results
         if filename:
-            processor.save_to_csv(filtered_papers, filename)
+            count = processor.save_to_csv(filtered_papers, filename)
             click.echo(f"Results saved to {filename}")
         else:
-            processor.print_results(filtered_papers)
+            count = processor.print_results(filtered_papers)
+        logger.info(f"Found {count} papers with company authors")
     
     except PubMedAPIError as e:
         logger.error(f"PubMed API error: {e}")
@@ -1,15 +1,48 @@
 """PubMed API client for fetching research papers."""
 
 import requests
-import xml.etree.ElementTree as ET
-from typing import List, Optional, Dict, Any
+from requests.adapters import HTTPAdapter, Retry
+from lxml import etree as ET
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Dict, Any, Tuple
 import logging
+import re
 from urllib.parse import urlencode
+import threading
 import time
 
 from .utils import Paper, Author
 
 
+# Element tag names looked up in the parsing loops
+_PUBMED_ARTICLE = 'PubmedArticle'
+_LAST_NAME = 'LastName'
+_FORE_NAME = 'ForeName'
+_YEAR = 'Year'
+_MONTH = 'Month'
+_DAY = 'Day'
+
+# XPath expressions compiled once and reused for every article
+_ID_XP = ET.XPath('.//Id')
+_PMID_XP = ET.XPath('.//PMID')
+_ARTICLE_TITLE_XP = ET.XPath('.//ArticleTitle')
+_AUTHOR_XP = ET.XPath('.//Author')
+_AFFILIATION_XP = ET.XPath('.//Affiliation')
+_DATE_FIELD_XPS = [
+    ET.XPath('.//PubDate'),
+    ET.XPath('.//ArticleDate'),
+    ET.XPath('.//DateCompleted')
+]
+
+# PubMed dates use either numeric or abbreviated English month names
+_MONTHS = {
+    'Jan': '01', 'Feb': '02', 'Mar': '03', 'Apr': '04', 'May': '05', 'Jun': '06',
+    'Jul': '07', 'Aug': '08', 'Sep': '09', 'Oct': '10', 'Nov': '11', 'Dec': '12'
+}
+
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+
+
 class PubMedAPIError(Exception):
     """Exception raised for PubMed API errors."""
     pass
@@ -19,15 +52,67 @@ class PubMedClient:
     """Client for interacting with PubMed API."""
     
     BASE_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
+    EFETCH_BATCH_SIZE = 200
+    POOL_SIZE = 16
+    STREAM_CHUNK_SIZE = 64 * 1024
+    # Rate-limited (429) and transient server error responses are retried
+    # through the client's rate limiter, up to MAX_RATE_LIMIT_RETRIES times
+    RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+    MAX_RATE_LIMIT_RETRIES = 3
+    DEFAULT_RETRY_AFTER = 1.0
+    SERVER_ERROR_BACKOFF = 0.3
     
     def __init__(self, email: Optional[str] = None, api_key: Optional[str] = None):
         """Initialize PubMed client."""
         self.email = email
         self.api_key = api_key
         self.session = requests.Session()
+        self.session.headers['Accept-Encoding'] = 'gzip'
+        
+        # Keep connections to eutils alive across (concurrent) requests and
+        # retry connection-level failures. Error responses are retried in
+        # _make_request so they go through the client's rate limiter.
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_SIZE,
+            pool_maxsize=self.POOL_SIZE,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=())
+        )
+        self.session.mount('https://', adapter)
         self.logger = logging.getLogger(__name__)
+        
+        # Rate limiting: 3 requests per second without API key, 10 with key
+        self._max_requests_per_second = 10 if api_key else 3
+        self._min_interval = 1.0 / self._max_requests_per_second
+        self._next_request_time = 0.0
+        self._rate_lock = threading.Lock()
+    
+    def _wait_for_rate_limit(self) -> None:
+        """Block until the next request slot allowed by the rate limit."""
+        with self._rate_lock:
+            now = time.monotonic()
+            slot = max(now, self._next_request_time)
+            self._next_request_time = slot + self._min_interval
+        
+        # Sleep outside the lock so other threads can reserve later slots
+        if slot > now:
+            time.sleep(slot - now)
     
-    def _make_request(self, endpoint: str, params: Dict[str, Any]) -> requests.Response:
+    def _defer_requests(self, delay: float) -> None:
+        """Push the next request slot back by delay seconds for all threads."""
+        with self._rate_lock:
+            self._next_request_time = max(
+                self._next_request_time, time.monotonic() + delay
+            )
+    
+    def _retry_after(self, response: requests.Response) -> float:
+        """Return the delay requested by a 429 response's Retry-After header."""
+        try:
+            return max(float(response.headers['Retry-After']), 0.0)
+        except (KeyError, ValueError):
+            return self.DEFAULT_RETRY_AFTER
+    
+    def _make_request(self, endpoint: str, params: Dict[str, Any],
+                      stream: bool = False) -> requests.Response:
         """Make a request to PubMed API with rate limiting."""
         if self.email:
             params['email'] = self.email
@@ -37,12 +122,22 @@ class PubMedClient:
         url = f"{self.BASE_URL}/{endpoint}"
         
         try:
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
+            for attempt in range(self.MAX_RATE_LIMIT_RETRIES + 1):
+                self._wait_for_rate_limit()
+                response = self.session.get(url, params=params, stream=stream)
+                if (response.status_code not in self.RETRY_STATUS_CODES
+                        or attempt == self.MAX_RATE_LIMIT_RETRIES):
+                    break
+                
+                # Back off every worker, then retry through the limiter
+                response.close()
+                if response.status_code == 429:
+                    delay = self._retry_after(response)
+                else:
+                    delay = self.SERVER_ERROR_BACKOFF * 2 ** attempt
+                self._defer_requests(delay)
             
-            # Rate limiting: 3 requests per second without API key, 10 with key
-            sleep_time = 0.1 if self.api_key else 0.34
-            time.sleep(sleep_time)
+            response.raise_for_status()
             
             return response
         except requests.RequestException as e:
@@ -61,7 +156,7 @@ class PubMedClient:
         
         try:
             root = ET.fromstring(response.content)
-            id_elements = root.findall('.//Id')
+            id_elements = _ID_XP(root)
             return [id_elem.text for id_elem in id_elements if id_elem.text]
         except ET.ParseError as e:
             raise PubMedAPIError(f"Failed to parse search response: {e}")
@@ -71,48 +166,81 @@ class PubMedClient:
         if not pubmed_ids:
             return []
         
+        batches = [
+            pubmed_ids[i:i + self.EFETCH_BATCH_SIZE]
+            for i in range(0, len(pubmed_ids), self.EFETCH_BATCH_SIZE)
+        ]
+        max_workers = min(self._max_requests_per_second, len(batches))
+        
+        papers = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # map() yields results in submission order
+            for batch_papers in executor.map(self._fetch_batch, batches):
+                papers.extend(batch_papers)
+        
+        return papers
+    
+    def _fetch_batch(self, pubmed_ids: List[str]) -> List[Paper]:
+        """Fetch and parse a single efetch batch of PubMed IDs."""
         params = {
             'db': 'pubmed',
             'id': ','.join(pubmed_ids),
             'retmode': 'xml'
         }
         
-        response = self._make_request('efetch.fcgi', params)
+        response = self._make_request('efetch.fcgi', params, stream=True)
         
         try:
-            root = ET.fromstring(response.content)
-            papers = []
+            papers: List[Paper] = []
+            parser = ET.XMLPullParser(events=('end',), tag=_PUBMED_ARTICLE)
             
-            for article in root.findall('.//PubmedArticle'):
-                paper = self._parse_article(article)
-                if paper:
-                    papers.append(paper)
+            # Parse the response incrementally and drop each article once it
+            # has been parsed, so only one article is held in memory at a time.
+            # iter_content() decodes gzip and wraps urllib3 read errors (e.g. a
+            # truncated body) in requests exceptions.
+            with response:
+                for chunk in response.iter_content(chunk_size=self.STREAM_CHUNK_SIZE):
+                    parser.feed(chunk)
+                    self._collect_articles(parser, papers)
+                parser.close()
+                self._collect_articles(parser, papers)
             
             return papers
         except ET.ParseError as e:
             raise PubMedAPIError(f"Failed to parse fetch response: {e}")
+        except (requests.RequestException, OSError) as e:
+            raise PubMedAPIError(f"Failed to read fetch response: {e}")
+    
+    def _collect_articles(self, parser: ET.XMLPullParser, papers: List[Paper]) -> None:
+        """Parse the articles completed so far and release their elements."""
+        parse_article = self._parse_article
+        
+        for _, elem in parser.read_events():
+            paper = parse_article(elem)
+            if paper:
+                papers.append(paper)
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
     
-    def _parse_article(self, article: ET.Element) -> Optional[Paper]:
+    def _parse_article(self, article: ET._Element) -> Optional[Paper]:
         """Parse a single article from XML."""
         try:
             # Extract PubMed ID
-            pubmed_id_elem = article.find('.//PMID')
-            if pubmed_id_elem is None:
+            pubmed_id_elems = _PMID_XP(article)
+            if not pubmed_id_elems:
                 return None
-            pubmed_id = pubmed_id_elem.text
+            pubmed_id = pubmed_id_elems[0].text
             
             # Extract title
-            title_elem = article.find('.//ArticleTitle')
-            title = title_elem.text if title_elem is not None else "Unknown Title"
+            title_elems = _ARTICLE_TITLE_XP(article)
+            title = title_elems[0].text if title_elems else "Unknown Title"
             
             # Extract publication date
             pub_date = self._extract_publication_date(article)
             
-            # Extract authors
-            authors = self._extract_authors(article)
-            
-            # Extract corresponding author email
-            corresponding_email = self._extract_corresponding_email(article)
+            # Extract authors and corresponding author email
+            authors, corresponding_email = self._parse_authors_and_email(article)
             
             return Paper(
                 pubmed_id=pubmed_id,
@@ -125,40 +253,60 @@ class PubMedClient:
             self.logger.warning(f"Failed to parse article: {e}")
             return None
     
-    def _extract_publication_date(self, article: ET.Element) -> str:
+    def _extract_publication_date(self, article: ET._Element) -> str:
         """Extract publication date from article."""
         # Try different date fields
-        date_fields = [
-            './/PubDate',
-            './/ArticleDate',
-            './/DateCompleted'
-        ]
-        
-        for field in date_fields:
-            date_elem = article.find(field)
-            if date_elem is not None:
-                year = date_elem.find('Year')
-                month = date_elem.find('Month')
-                day = date_elem.find('Day')
+        for date_field_xp in _DATE_FIELD_XPS:
+            date_elems = date_field_xp(article)
+            if date_elems:
+                date_elem = date_elems[0]
+                year = date_elem.find(_YEAR)
+                month = date_elem.find(_MONTH)
+                day = date_elem.find(_DAY)
+                
+                if year is None:
+                    continue
+                if month is None:
+                    return year.text
                 
-                if year is not None:
-                    date_parts = [year.text]
-                    if month is not None:
-                        date_parts.append(month.text.zfill(2))
-                    if day is not None:
-                        date_parts.append(day.text.zfill(2))
-                    return '-'.join(date_parts)
+                month_text = month.text.strip()
+                if month_text.isdigit():
+                    month_num = month_text.zfill(2)
+                else:
+                    month_num = _MONTHS.get(month_text[:3].title())
+                    if month_num is None:
+                        return year.text
+                
+                if day is None:
+                    return f"{year.text}-{month_num}"
+                return f"{year.text}-{month_num}-{day.text.zfill(2)}"
         
         return "Unknown Date"
     
-    def _extract_authors(self, article: ET.Element) -> List[Author]:
-        """Extract authors from article."""
+    def _parse_authors_and_email(
+        self, article: ET._Element
+    ) -> Tuple[List[Author], Optional[str]]:
+        """Extract authors and the corresponding author email in one pass."""
         authors = []
+        corresponding_email = None
+        affiliation_xp = _AFFILIATION_XP
         
-        for author_elem in article.findall('.//Author'):
+        for author_elem in _AUTHOR_XP(article):
+            find = author_elem.find
+            
+            # Extract affiliation
+            affiliation_elems = affiliation_xp(author_elem)
+            affiliation = affiliation_elems[0].text if affiliation_elems else None
+            
+            # The first email found in any affiliation is the corresponding one
+            if corresponding_email is None and affiliation:
+                email_match = _EMAIL_RE.search(affiliation)
+                if email_match:
+                    corresponding_email = email_match.group(0)
+            
             # Extract name
-            last_name = author_elem.find('LastName')
-            first_name = author_elem.find('ForeName')
+            last_name = find(_LAST_NAME)
+            first_name = find(_FORE_NAME)
             
             if last_name is not None:
                 name = last_name.text
@@ -167,27 +315,6 @@ class PubMedClient:
             else:
                 continue
             
-            # Extract affiliation
-            affiliation_elem = author_elem.find('.//Affiliation')
-            affiliation = affiliation_elem.text if affiliation_elem is not None else ""
-            
-            authors.append(Author(name=name, affiliation=affiliation))
+            authors.append(Author(name=name, affiliation=affiliation or ""))
         
-        return authors
-    
-    def _extract_corresponding_email(self, article: ET.Element) -> Optional[str]:
-        """Extract corresponding author email."""
-        # Look for email in author information
-        for author_elem in article.findall('.//Author'):
-            affiliation_elem = author_elem.find('.//Affiliation')
-            if affiliation_elem is not None:
-                affiliation_text = affiliation_elem.text
-                if affiliation_text:
-                    # Simple email extraction
-                    import re
-                    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-                    emails = re.findall(email_pattern, affiliation_text)
-                    if emails:
-                        return emails[0]
-        
-        return None
\ No newline at end of file
+        return authors, corresponding_email
@@ -1,7 +1,8 @@
 """Utility functions and data models for the research paper fetcher."""
 
 from dataclasses import dataclass
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple
 import re
 
 
@@ -54,48 +55,72 @@ class CompanyDetector:
         "takeda", "genentech", "boehringer", "vertex", "illumina",
         "novo nordisk", "servier"
     ]
-    @classmethod
-    def is_non_academic(cls, affiliation: str) -> bool:
-        """Check if an affiliation is non-academic."""
-
-        # print(f"DEBUG affiliation check: {affiliation}")
-
+    COMPANY_DISPLAY_NAMES = {
+        "novartis": "Novartis", "pfizer": "Pfizer", "roche": "Roche",
+        "astrazeneca": "AstraZeneca", "gilead": "Gilead Sciences",
+        "johnson & johnson": "Johnson & Johnson", "lilly": "Eli Lilly",
+        "sanofi": "Sanofi", "bayer": "Bayer", "abbvie": "AbbVie",
+        "bristol-myers": "Bristol-Myers Squibb", "amgen": "Amgen",
+        "regeneron": "Regeneron", "biogen": "Biogen", "merck": "Merck",
+        "takeda": "Takeda", "genentech": "Genentech",
+        "boehringer": "Boehringer Ingelheim", "vertex": "Vertex Pharmaceuticals",
+        "illumina": "Illumina", "novo nordisk": "Novo Nordisk", "servier": "Servier"
+    }
+    # All keyword lists are scanned in a single pass: the zero-width lookahead
+    # reports one (possibly overlapping) match per position, and the group
+    # order makes a company hit shadow an academic or pharma hit at the same
+    # position, which never changes the outcome given the precedence below.
+    _KEYWORD_RE = re.compile(
+        '(?=(?P<company>{})|(?P<academic>{})|(?P<pharma>{}))'.format(
+            '|'.join(map(re.escape, COMPANY_NAMES)),
+            '|'.join(map(re.escape, ACADEMIC_KEYWORDS)),
+            '|'.join(map(re.escape, PHARMA_BIOTECH_KEYWORDS)),
+        )
+    )
+    # Company names are only reported when they appear as whole words, so
+    # e.g. "Illuminate Labs" is not reported as Illumina
+    _COMPANY_WORD_RE = re.compile(
+        r'\b(?:{})\b'.format('|'.join(map(re.escape, COMPANY_NAMES)))
+    )
+    _CORP_RE = re.compile(r'\b(?:inc|corp|ltd|llc|co|company|corporation)\b')
+
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def classify(affiliation: str) -> Tuple[bool, Optional[str]]:
+        """Classify an affiliation in one scan as (is_non_academic, company_name)."""
+        # Lowercase once and run every scan on that copy (patterns are lowercase)
         affiliation_lower = affiliation.lower()
 
-        # Check for known company names first
-        for company in cls.COMPANY_NAMES:
-            if company in affiliation_lower:
-                # print(f"Matched known company: {company} in {affiliation}")
-                return True
-
-        # Check for corporate suffixes
-        corporate_patterns = [
-            r'\binc\.?\b', r'\bcorp\.?\b', r'\bltd\.?\b', r'\bllc\.?\b',
-            r'\bco\.?\b', r'\bcompany\b', r'\bcorporation\b'
-        ]
-
-        for pattern in corporate_patterns:
-            if re.search(pattern, affiliation_lower):
-                # print(f"Matched corporate pattern: {pattern} in {affiliation}")
-                return True
-
-        # Check for academic keywords
-        for keyword in cls.ACADEMIC_KEYWORDS:
-            if keyword in affiliation_lower:
-                # print(f"Academic keyword detected: {keyword} in {affiliation}")
-                return False
-
-        # Check for pharma/biotech keywords
-        for keyword in cls.PHARMA_BIOTECH_KEYWORDS:
-            if keyword in affiliation_lower:
-                # print(f"Matched pharma/biotech keyword: {keyword} in {affiliation}")
-                return True
-
-        return False
+        # Precedence: company name > corporate suffix > academic > pharma/biotech
+        seen = set()
+        for match in CompanyDetector._KEYWORD_RE.finditer(affiliation_lower):
+            if match.lastgroup == 'company':
+                name_match = CompanyDetector._COMPANY_WORD_RE.search(
+                    affiliation_lower, match.start()
+                )
+                if name_match:
+                    return True, CompanyDetector.COMPANY_DISPLAY_NAMES[name_match.group()]
+                return True, CompanyDetector._first_segment(affiliation)
+            seen.add(match.lastgroup)
+
+        if CompanyDetector._CORP_RE.search(affiliation_lower) or (
+            'academic' not in seen and 'pharma' in seen
+        ):
+            return True, CompanyDetector._first_segment(affiliation)
+        return False, None
+
+    @staticmethod
+    def is_non_academic(affiliation: str) -> bool:
+        """Check if an affiliation is non-academic."""
+        return CompanyDetector.classify(affiliation)[0]
 
-    @classmethod
-    def extract_company_name(cls, affiliation: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def extract_company_name(affiliation: str) -> str:
         """Extract company name from affiliation string."""
-        # Simple extraction - take the first part before comma or semicolon
-        parts = re.split(r'[,;]', affiliation)
-        return parts[0].strip()
\ No newline at end of file
+        return CompanyDetector._first_segment(affiliation)
+
+    @staticmethod
+    def _first_segment(affiliation: str) -> str:
+        """Return the part of an affiliation before the first comma or semicolon."""
+        return affiliation.split(',', 1)[0].split(';', 1)[0].strip()
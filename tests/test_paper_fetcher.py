@@ -0,0 +1,186 @@
+"""Tests for PubMed XML parsing in PubMedClient."""
+
+import io
+
+import pytest
+import requests
+from lxml import etree as ET
+
+from research_paper_fetcher import paper_fetcher
+from research_paper_fetcher.paper_fetcher import PubMedAPIError, PubMedClient
+
+
+def _response(status: int, body: bytes = b"", headers=None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers or {})
+    response.raw = io.BytesIO(body)
+    response.url = PubMedClient.BASE_URL
+    return response
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record rate limiter sleeps instead of sleeping."""
+    recorded = []
+    monkeypatch.setattr(paper_fetcher.time, 'sleep', recorded.append)
+    return recorded
+
+
+@pytest.fixture
+def client():
+    return PubMedClient()
+
+
+def _stub_get(monkeypatch, client, responses):
+    calls = []
+
+    def get(url, params=None, stream=False):
+        calls.append(params)
+        return responses.pop(0)
+
+    monkeypatch.setattr(client.session, 'get', get)
+    return calls
+
+
+def _article(pub_date: str) -> ET._Element:
+    return ET.fromstring(f"<PubmedArticle><PubDate>{pub_date}</PubDate></PubmedArticle>")
+
+
+@pytest.mark.parametrize('pub_date, expected', [
+    ("<Year>2023</Year><Month>6</Month><Day>5</Day>", "2023-06-05"),
+    ("<Year>2023</Year><Month>11</Month>", "2023-11"),
+    ("<Year>2023</Year><Month>Jun</Month><Day>5</Day>", "2023-06-05"),
+    ("<Year>2023</Year><Month>June</Month>", "2023-06"),
+    ("<Year>2023</Year><Month>Spring</Month>", "2023"),
+    ("<Year>2023</Year><Day>5</Day>", "2023"),
+    ("<Year>2023</Year>", "2023"),
+    ("<MedlineDate>2023 Jan-Feb</MedlineDate>", "Unknown Date"),
+])
+def test_extract_publication_date(pub_date, expected):
+    assert PubMedClient()._extract_publication_date(_article(pub_date)) == expected
+
+
+def test_rate_limited_request_is_retried_through_limiter(monkeypatch, client, sleeps):
+    calls = _stub_get(monkeypatch, client, [_response(429), _response(200, b"ok")])
+
+    response = client._make_request('esearch.fcgi', {})
+
+    assert response.status_code == 200
+    assert len(calls) == 2
+    # The retry waited for the slot pushed back by the default Retry-After
+    assert sleeps[-1] == pytest.approx(PubMedClient.DEFAULT_RETRY_AFTER, abs=0.05)
+
+
+def test_numeric_retry_after_is_honoured(monkeypatch, client, sleeps):
+    _stub_get(monkeypatch, client, [
+        _response(429, headers={'Retry-After': '2'}), _response(200)
+    ])
+
+    client._make_request('esearch.fcgi', {})
+
+    assert sleeps[-1] == pytest.approx(2.0, abs=0.05)
+
+
+def test_non_numeric_retry_after_falls_back_to_default(client):
+    response = _response(429, headers={'Retry-After': 'Wed, 21 Oct 2026 07:28:00 GMT'})
+
+    assert client._retry_after(response) == PubMedClient.DEFAULT_RETRY_AFTER
+
+
+def test_server_error_is_retried_through_limiter(monkeypatch, client, sleeps):
+    calls = _stub_get(monkeypatch, client, [_response(503), _response(200)])
+
+    client._make_request('esearch.fcgi', {})
+
+    assert len(calls) == 2
+    assert sleeps[-1] == pytest.approx(PubMedClient.SERVER_ERROR_BACKOFF, abs=0.05)
+
+
+def test_defer_requests_pushes_back_shared_slot(client):
+    client._defer_requests(5.0)
+
+    assert client._next_request_time >= paper_fetcher.time.monotonic() + 4.9
+
+
+def test_too_many_rate_limited_responses_raise(monkeypatch, client, sleeps):
+    responses = [_response(429) for _ in range(PubMedClient.MAX_RATE_LIMIT_RETRIES + 1)]
+    calls = _stub_get(monkeypatch, client, responses)
+
+    with pytest.raises(PubMedAPIError):
+        client._make_request('esearch.fcgi', {})
+    assert len(calls) == PubMedClient.MAX_RATE_LIMIT_RETRIES + 1
+
+
+def _efetch_body(pmids) -> bytes:
+    articles = ''.join(
+        f"<PubmedArticle><MedlineCitation><PMID>{pmid}</PMID><Article>"
+        f"<ArticleTitle>Title {pmid}</ArticleTitle><AuthorList><Author>"
+        f"<LastName>Doe</LastName><ForeName>Jane</ForeName><AffiliationInfo>"
+        f"<Affiliation>Pfizer Inc., New York, USA. jane{pmid}@pfizer.com</Affiliation>"
+        f"</AffiliationInfo></Author></AuthorList></Article></MedlineCitation>"
+        f"</PubmedArticle>"
+        for pmid in pmids
+    )
+    return f'<?xml version="1.0"?><PubmedArticleSet>{articles}</PubmedArticleSet>'.encode()
+
+
+class _FailingRaw(io.BytesIO):
+    """Raw body that fails with a requests read error after some bytes."""
+
+    def __init__(self, body: bytes, fail_after: int):
+        super().__init__(body)
+        self.fail_after = fail_after
+
+    def read(self, size=-1):
+        if self.tell() >= self.fail_after:
+            raise requests.exceptions.ChunkedEncodingError("Connection broken")
+        return super().read(size)
+
+
+def test_fetch_batch_parses_articles_split_across_chunks(monkeypatch, client):
+    pmids = ['101', '102', '103']
+    _stub_get(monkeypatch, client, [_response(200, _efetch_body(pmids))])
+    # Small chunks so article boundaries fall mid-chunk and mid-element
+    client.STREAM_CHUNK_SIZE = 37
+
+    papers = client._fetch_batch(pmids)
+
+    assert [paper.pubmed_id for paper in papers] == pmids
+    assert papers[1].title == "Title 102"
+    assert papers[1].authors[0].name == "Jane Doe"
+    assert papers[1].corresponding_author_email == "jane102@pfizer.com"
+
+
+def test_fetch_batch_truncated_document_raises(monkeypatch, client):
+    body = _efetch_body(['101', '102'])
+    _stub_get(monkeypatch, client, [_response(200, body[:len(body) // 2])])
+    client.STREAM_CHUNK_SIZE = 37
+
+    with pytest.raises(PubMedAPIError):
+        client._fetch_batch(['101', '102'])
+
+
+def test_fetch_batch_read_error_raises(monkeypatch, client):
+    body = _efetch_body(['101', '102'])
+    response = _response(200)
+    response.raw = _FailingRaw(body, fail_after=len(body) // 2)
+    _stub_get(monkeypatch, client, [response])
+    client.STREAM_CHUNK_SIZE = 37
+
+    with pytest.raises(PubMedAPIError):
+        client._fetch_batch(['101', '102'])
+
+
+def test_fetch_paper_details_keeps_batch_order(monkeypatch, client):
+    def get(url, params=None, stream=False):
+        return _response(200, _efetch_body(params['id'].split(',')))
+
+    monkeypatch.setattr(client.session, 'get', get)
+    monkeypatch.setattr(paper_fetcher.time, 'sleep', lambda seconds: None)
+    client.EFETCH_BATCH_SIZE = 2
+    pmids = [str(pmid) for pmid in range(1, 8)]
+
+    papers = client.fetch_paper_details(pmids)
+
+    assert [paper.pubmed_id for paper in papers] == pmids
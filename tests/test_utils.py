@@ -0,0 +1,22 @@
+"""Tests for affiliation classification in CompanyDetector."""
+
+import pytest
+
+from research_paper_fetcher.utils import CompanyDetector
+
+
+@pytest.mark.parametrize('affiliation, expected', [
+    ("AbbVie Inc., North Chicago, IL, USA", (True, "AbbVie")),
+    ("AstraZeneca, Cambridge, UK", (True, "AstraZeneca")),
+    ("Eli Lilly and Company, Indianapolis, IN, USA", (True, "Eli Lilly")),
+    ("Bristol-Myers Squibb, Princeton, NJ, USA", (True, "Bristol-Myers Squibb")),
+    ("Illuminate Labs, San Diego, CA, USA", (True, "Illuminate Labs")),
+    ("Acme Therapeutics; Boston, MA, USA", (True, "Acme Therapeutics")),
+    ("Department of Oncology, Harvard University, Boston, MA", (False, None)),
+])
+def test_classify(affiliation, expected):
+    assert CompanyDetector.classify(affiliation) == expected
+
+
+def test_company_names_have_display_names():
+    assert set(CompanyDetector.COMPANY_NAMES) == set(CompanyDetector.COMPANY_DISPLAY_NAMES)